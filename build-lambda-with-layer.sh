@@ -78,6 +78,10 @@ fi
 # Copy any additional files if they exist
 [ -f "*.json" ] && cp *.json build/ 2>/dev/null || true
 
+# Precompile bytecode so cold starts skip source-to-bytecode compilation
+echo "Precompiling Python bytecode..."
+python3 -m compileall -q build
+
 # Create the zip package
 echo "Creating deployment package..."
 cd build
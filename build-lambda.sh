@@ -30,7 +30,10 @@ pip install --upgrade -r requirements.txt -t build
 # 4) Copy source code into 'build' folder
 cp app.py build/
 
-# 5) Create the zip package
+# 5) Precompile bytecode so cold starts skip source-to-bytecode compilation
+python3 -m compileall -q build
+
+# 6) Create the zip package
 cd build
 zip -r ../lambda.zip .  > /dev/null
 
@@ -58,6 +58,10 @@ find "$BUILD_DIR" -type f -name "README*" -delete
 find "$BUILD_DIR" -type f -name "CHANGELOG*" -delete
 find "$BUILD_DIR" -type f -name "LICENSE*" -delete
 
+# Precompile the shared package (run after cleanup so these .pyc survive);
+# dependency bytecode stays stripped to keep the layer small
+python3 -m compileall -q "$BUILD_DIR/python/lib/python3.13/site-packages/shared"
+
 echo "Creating layer package..."
 
 # Create the zip package from the build directory
@@ -1,7 +1,8 @@
 import json
 import os
 import boto3
-from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
 
 sqs = boto3.client("sqs")
 QUEUE_URL = os.environ["ADMIN_SELECTION_QUEUE_URL"]
@@ -21,23 +22,50 @@ def lambda_handler(event, context):
                 })
             }
 
-        base_date = datetime.strptime(show_date, "%Y-%m-%d").date()
+        base_date = date.fromisoformat(show_date)
         submitted_at = datetime.now(timezone.utc).isoformat()
 
+        entries = []
         for day_offset in range(14):
             date_obj = base_date + timedelta(days=day_offset)
             message_body = {
                 "movieId": movie_id,
                 "movieTitle": movie_title,
-                "showDate": date_obj.strftime("%Y-%m-%d"),
+                "showDate": date_obj.isoformat(),
                 "submittedAt": submitted_at
             }
+            entries.append({
+                "Id": str(day_offset),
+                "MessageBody": json.dumps(message_body)
+            })
 
-            sqs.send_message(
+        # SQS allows at most 10 entries per batch request
+        retries = []
+        for start in range(0, len(entries), 10):
+            chunk = entries[start:start + 10]
+            response = sqs.send_message_batch(
                 QueueUrl=QUEUE_URL,
-                MessageBody=json.dumps(message_body)
+                Entries=chunk
             )
 
+            for failure in response.get("Failed", []):
+                failed_entry = next(
+                    e for e in chunk if e["Id"] == failure["Id"]
+                )
+                print(f"[WARN] Batch entry {failure['Id']} failed "
+                      f"({failure.get('Code')}), retrying individually")
+                retries.append(failed_entry["MessageBody"])
+
+        # boto3 clients are thread-safe; retry any stragglers concurrently
+        if retries:
+            with ThreadPoolExecutor(max_workers=len(retries)) as executor:
+                list(executor.map(
+                    lambda body: sqs.send_message(
+                        QueueUrl=QUEUE_URL, MessageBody=body
+                    ),
+                    retries
+                ))
+
         return {
             "statusCode": 202,
             "body": json.dumps({
@@ -1,56 +1,78 @@
-import json
 import boto3
+import orjson
 import os
 from decimal import Decimal
+from boto3.dynamodb.conditions import Key
 
-def clean_decimals(obj):
-    if isinstance(obj, list):
-        return [clean_decimals(v) for v in obj]
-    elif isinstance(obj, dict):
-        return {k: clean_decimals(v) for k, v in obj.items()}
-    elif isinstance(obj, Decimal):
-        # return int(v) if v == int(v) else float(v)
+def _json_default(obj):
+    """orjson fallback for types it can't serialize natively."""
+    if isinstance(obj, Decimal):
         return float(obj)
-    else:
-        return obj
+    return str(obj)
+
+def dumps(obj) -> str:
+    return orjson.dumps(obj, default=_json_default).decode()
 
 dynamodb = boto3.resource("dynamodb")
 table = dynamodb.Table(os.environ.get("MOVIE_SHOWTIME_OPTIONS_TABLE", "movie_showtime_options"))
 
+def filter_theaters(theaters, filter_theater, filter_date):
+    """Apply the optional theater/date filters in one pass per level."""
+    if filter_theater:
+        needle = filter_theater.lower()
+        theaters = [t for t in theaters if needle in t["name"].lower()]
+
+    if filter_date:
+        kept_theaters = []
+        for theater in theaters:
+            kept_formats = []
+            for fmt in theater.get("formats", []):
+                slots = [
+                    s for s in fmt.get("slots", [])
+                    if s.get("date") == filter_date
+                ]
+                if slots:
+                    fmt["slots"] = slots
+                    kept_formats.append(fmt)
+            if kept_formats:
+                theater["formats"] = kept_formats
+                kept_theaters.append(theater)
+        theaters = kept_theaters
+
+    return theaters
+
 def handler(event, context):
     try:
         params = event.get("queryStringParameters") or {}
         filter_theater = params.get("theater")  # Optional
         filter_date = params.get("date")        # Optional
+        movie_id = params.get("movieId")        # Optional
 
-        # Scan the entire table (there should only be one record)
-        response = table.scan(Limit=14)
+        # Only pull the attributes the response is built from
+        projection = "movieId, movieTitle, showDate, theaters"
+
+        if movie_id:
+            # Query the partition directly instead of scanning the table
+            response = table.query(
+                KeyConditionExpression=Key("movieId").eq(movie_id),
+                ProjectionExpression=projection
+            )
+        else:
+            # Fallback: scan the table (there should only be one record)
+            response = table.scan(Limit=14, ProjectionExpression=projection)
         items = response.get("Items", [])
         if not items:
             return {
                 "statusCode": 404,
-                "body": json.dumps({"error": "No showtimes found in table"})
+                "body": dumps({"error": "No showtimes found in table"})
             }
 
         all_results = []
 
         for item in items:
-            theaters = item.get("theaters", [])
-
-            # Optional theater filter
-            if filter_theater:
-                theaters = [t for t in theaters if filter_theater.lower() in t["name"].lower()]
-
-            # Optional date filter
-            if filter_date:
-                for theater in theaters:
-                    for fmt in theater.get("formats", []):
-                        fmt["slots"] = [
-                            s for s in fmt.get("slots", [])
-                            if s.get("date") == filter_date
-                        ]
-                    theater["formats"] = [f for f in theater["formats"] if f["slots"]]
-                theaters = [t for t in theaters if t["formats"]]
+            theaters = filter_theaters(
+                item.get("theaters", []), filter_theater, filter_date
+            )
 
             # Only include results with theaters after filtering
             if theaters:
@@ -63,16 +85,11 @@ def handler(event, context):
 
         return {
             "statusCode": 200,
-            "body": json.dumps(clean_decimals({
-                "movieId": item["movieId"],
-                "movieTitle": item["movieTitle"],
-                "showDate": item["showDate"],
-                "theaters": theaters
-            }))
+            "body": dumps(all_results)
         }
 
     except Exception as e:
         return {
             "statusCode": 500,
-            "body": json.dumps({"error": str(e)})
+            "body": dumps({"error": str(e)})
         }
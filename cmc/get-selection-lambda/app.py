@@ -25,18 +25,26 @@ def handler(event, context):
 
         # Optional theater filter
         if filter_theater:
-            theaters = [t for t in theaters if filter_theater.lower() in t["name"].lower()]
+            needle = filter_theater.lower()
+            theaters = [t for t in theaters if needle in t["name"].lower()]
 
-        # Optional date filter
+        # Optional date filter, pruning empty formats/theaters in the same pass
         if filter_date:
+            kept_theaters = []
             for theater in theaters:
+                kept_formats = []
                 for fmt in theater.get("formats", []):
-                    fmt["slots"] = [
+                    slots = [
                         s for s in fmt.get("slots", [])
                         if s.get("date") == filter_date
                     ]
-                theater["formats"] = [f for f in theater["formats"] if f["slots"]]
-            theaters = [t for t in theaters if t["formats"]]
+                    if slots:
+                        fmt["slots"] = slots
+                        kept_formats.append(fmt)
+                if kept_formats:
+                    theater["formats"] = kept_formats
+                    kept_theaters.append(theater)
+            theaters = kept_theaters
 
         return {
             "statusCode": 200,
@@ -1,11 +1,15 @@
+import asyncio
 import html
 import json
+import re
+import time
 import boto3
 import os
-import requests
+import aiohttp
+from botocore.exceptions import ClientError
 from datetime import datetime, timezone
-from bs4 import BeautifulSoup
-from collections import defaultdict
+from collections import OrderedDict
+from lxml import html as lxhtml
 from difflib import get_close_matches
 
 # Initialize DynamoDB
@@ -24,58 +28,141 @@ KNOWN_FORMATS = {
     "dine-in delivery to seat": "Dine-In Delivery To Seat",
     "laser at amc": "Laser At AMC"
 }
+_FMT_RE = re.compile("|".join(re.escape(k) for k in KNOWN_FORMATS), re.I)
 
 def normalize_format(raw: str) -> str:
-    clean = raw.strip().lower()
-    for known in KNOWN_FORMATS:
-        if known in clean:
-            return KNOWN_FORMATS[known]
-    return "Other"
+    m = _FMT_RE.search(raw)
+    return KNOWN_FORMATS[m.group(0).lower()] if m else "Other"
+
+# Warm containers re-scrape identical pages; cache parsed results per
+# (slug, title, date) with a short TTL and LRU eviction
+_SHOWTIME_CACHE = OrderedDict()  # key -> (epoch_fetched, {format: set(slots)})
+_CACHE_TTL = 300
+_CACHE_MAX_ENTRIES = 128
+
+# Keep one event loop and pooled ClientSession alive for the lifetime of the
+# container so warm invocations reuse TCP/TLS connections to amctheatres.com
+_LOOP = asyncio.new_event_loop()
+_session = None
+
+
+def _get_session():
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            headers={"User-Agent": "Mozilla/5.0"},
+            connector=aiohttp.TCPConnector(limit=20),
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
+    return _session
+
+
+async def _fetch(session, slug, url):
+    async with session.get(url) as res:
+        if res.status != 200:
+            print(f"[WARN] Failed to fetch from {url}")
+            return slug, None
+        return slug, await res.text()
+
+
+async def _fetch_all_theaters(base_url: str, date_str: str, slugs: list) -> list:
+    session = _get_session()
+    tasks = [
+        _fetch(session, slug, f"{base_url}/{slug}/showtimes?date={date_str}")
+        for slug in slugs
+    ]
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
 
 def fetch_amc_showtimes_for_day(movie_title: str, date_str: str) -> list:
     base_url = "https://www.amctheatres.com/movie-theatres/chicago"
-    headers = {"User-Agent": "Mozilla/5.0"}
-    results_by_theater = defaultdict(lambda: defaultdict(set))
+    results_by_theater = {}  # (slug, format) -> set of slot times
     normalized_title = movie_title.strip().lower()
 
+    now = time.time()
+    slugs_to_fetch = []
     for slug in AMC_THEATER_SLUGS:
-        url = f"{base_url}/{slug}/showtimes?date={date_str}"
-        print(f"Scraping {url}")
-        try:
-            res = requests.get(url, headers=headers)
-            if res.status_code != 200:
-                print(f"[WARN] Failed to fetch from {url}")
-                continue
+        key = (slug, normalized_title, date_str)
+        cached = _SHOWTIME_CACHE.get(key)
+        if cached and now - cached[0] < _CACHE_TTL:
+            _SHOWTIME_CACHE.move_to_end(key)
+            for fmt, slots in cached[1].items():
+                results_by_theater.setdefault((slug, fmt), set()).update(slots)
+        else:
+            slugs_to_fetch.append(slug)
+
+    if not slugs_to_fetch:
+        print(f"[CACHE] All theaters cached for {date_str}")
+        return _assemble_results(results_by_theater, date_str)
+
+    print(f"Scraping {len(slugs_to_fetch)} theaters for {date_str}")
+    pages = _LOOP.run_until_complete(
+        _fetch_all_theaters(base_url, date_str, slugs_to_fetch)
+    )
+
+    # Cheap pre-filter: skip DOM construction entirely for pages that never
+    # mention the movie in a showtimes aria-label. The raw markup carries
+    # entity-escaped attribute values (&amp;, &#x27;, ...) that lxml only
+    # unescapes during the parse, so titles are matched in both spellings
+    escaped_title = html.escape(normalized_title, quote=True)
+    label_re = re.compile(
+        r'aria-label="[^"]*showtimes for (?:'
+        + re.escape(normalized_title)
+        + '|'
+        + re.escape(escaped_title)
+        + ')',
+        re.I
+    )
+
+    fetched_ok = set()
+    for page in pages:
+        if isinstance(page, Exception):
+            print(f"[ERROR] Scraping failed: {page}")
+            continue
 
-            soup = BeautifulSoup(res.text, "html.parser")
-            sections = soup.find_all("section", attrs={"aria-label": True})
+        slug, page_html = page
+        if page_html is None:
+            continue
 
-            for section in sections:
-                aria_label = html.unescape(section["aria-label"].strip()).lower()
-                if f"showtimes for {normalized_title}" not in aria_label:
+        if not label_re.search(page_html):
+            print(f"[SKIP] No showtime section for title at {slug}")
+            fetched_ok.add(slug)
+            continue
+
+        try:
+            root = lxhtml.fromstring(page_html)
+
+            needle = f"showtimes for {normalized_title}"
+            for section in root.xpath("//section[@aria-label]"):
+                # lxml unescapes attribute entities during the parse
+                aria_label = section.get("aria-label").strip().lower()
+                if needle not in aria_label:
                     continue
-                
+
                 title_in_label = aria_label.replace("showtimes for ", "").strip()
                 if not get_close_matches(normalized_title, [title_in_label], n=1, cutoff=0.7):
                     print(f"[SKIP] No fuzzy match for {normalized_title} in: {aria_label}")
                     continue
 
-                format_blocks = section.find_all(["li", "div"], recursive=True)
-
-                for block in format_blocks:
-                    showtime_links = block.find_all("a", href=True)
-                    showtimes = [
-                        a.get_text(strip=True)
-                        for a in showtime_links
-                        if "/showtimes/" in a["href"]
-                    ]
-                    if not showtimes:
+                # One XPath pass for the anchors, grouped by their
+                # enclosing li/div, instead of re-walking the subtree per block
+                blocks_by_id = {}
+                for a in section.xpath('.//a[contains(@href, "/showtimes/")]'):
+                    block = a.xpath("ancestor::*[self::li or self::div][1]")
+                    if not block:
                         continue
+                    block = block[0]
+                    blocks_by_id.setdefault(id(block), (block, []))[1].append(
+                        a.text_content().strip()
+                    )
 
-                    format_label_tag = block.find(["span", "p"])
+                for block, showtimes in blocks_by_id.values():
+                    label_tags = block.xpath(
+                        "descendant::*[self::span or self::p][1]"
+                    )
                     raw_format = (
-                        format_label_tag.get_text(strip=True).title()
-                        if format_label_tag else "Standard"
+                        label_tags[0].text_content().strip().title()
+                        if label_tags else "Standard"
                     )
 
                     label_clean = raw_format.lower()
@@ -85,21 +172,59 @@ def fetch_amc_showtimes_for_day(movie_title: str, date_str: str) -> list:
                     format_key = normalize_format(raw_format)
 
                     for slot in showtimes:
-                        results_by_theater[slug][format_key].add(slot)
+                        results_by_theater.setdefault(
+                            (slug, format_key), set()
+                        ).add(slot)
 
                 break  # Only one match per movie per section
 
+            fetched_ok.add(slug)
         except Exception as e:
-            print(f"[ERROR] Scraping failed for {url}: {e}")
+            print(f"[ERROR] Parsing failed for {slug}: {e}")
+
+    # Cache only slugs that were fetched and parsed; a failed fetch must
+    # not pin an empty showtime map for the TTL, so those slugs stay
+    # uncached and the next invocation retries them
+    for slug in slugs_to_fetch:
+        if slug not in fetched_ok:
+            continue
+        key = (slug, normalized_title, date_str)
+        _SHOWTIME_CACHE[key] = (
+            now,
+            {
+                fmt: set(slots)
+                for (s, fmt), slots in results_by_theater.items()
+                if s == slug
+            }
+        )
+        _SHOWTIME_CACHE.move_to_end(key)
+    while len(_SHOWTIME_CACHE) > _CACHE_MAX_ENTRIES:
+        _SHOWTIME_CACHE.popitem(last=False)
+
+    return _assemble_results(results_by_theater, date_str)
+
+
+def _slot_sort_key(slot: str):
+    """Chronological key for times like '7:00pm'; unparseable slots sort last."""
+    try:
+        return (0, datetime.strptime(slot, "%I:%M%p"))
+    except ValueError:
+        return (1, datetime.min)
+
+
+def _assemble_results(results_by_theater, date_str: str) -> list:
+    by_slug = {}
+    for (slug, fmt), slots in results_by_theater.items():
+        by_slug.setdefault(slug, {})[fmt] = slots
 
     final_results = []
-    for slug, formats in results_by_theater.items():
+    for slug, formats in by_slug.items():
         formatted = [
             {
                 "type": fmt,
                 "slots": [
                     {"time": slot, "date": date_str}
-                    for slot in sorted(slots)
+                    for slot in sorted(slots, key=_slot_sort_key)
                 ]
             }
             for fmt, slots in formats.items()
@@ -113,7 +238,26 @@ def fetch_amc_showtimes_for_day(movie_title: str, date_str: str) -> list:
     return final_results
 
 
+def _write_items(items: list):
+    """Batch-write items, backing off on throttled writes."""
+    for attempt in range(5):
+        try:
+            with table.batch_writer(
+                overwrite_by_pkeys=["movieId", "showDate"]
+            ) as bw:
+                for item in items:
+                    bw.put_item(Item=item)
+            return
+        except ClientError as e:
+            code = e.response["Error"]["Code"]
+            if code != "ProvisionedThroughputExceededException" or attempt == 4:
+                raise
+            print(f"[WARN] Write throttled, retrying (attempt {attempt + 1})")
+            time.sleep(2 ** attempt)
+
+
 def handler(event, context):
+    items = []
     for record in event.get("Records", []):
         try:
             body = json.loads(record["body"])
@@ -130,16 +274,24 @@ def handler(event, context):
                 print(f"[SKIP] No showtimes found for movieId={movie_id} on {show_date}")
                 continue
 
-            item = {
+            items.append({
                 "movieId": movie_id,
                 "showDate": show_date,
                 "movieTitle": movie_title,
                 "createdAt": datetime.now(timezone.utc).isoformat(),
                 "theaters": theaters
-            }
-
-            table.put_item(Item=item)
-            print(f"[SUCCESS] Stored movieId={movie_id} showDate={show_date}")
+            })
 
         except Exception as e:
             print(f"[ERROR] Failed to process record: {e}")
+
+    if not items:
+        return
+
+    try:
+        _write_items(items)
+        for item in items:
+            print(f"[SUCCESS] Stored movieId={item['movieId']} "
+                  f"showDate={item['showDate']}")
+    except Exception as e:
+        print(f"[ERROR] Failed to store showtimes: {e}")
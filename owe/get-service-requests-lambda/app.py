@@ -1,23 +1,44 @@
-import json
 import boto3
+import orjson
 import os
-from datetime import datetime
-from uuid import uuid4
+from decimal import Decimal
 
 dynamodb = boto3.resource('dynamodb')
 table_name = os.environ.get('DYNAMODB_TABLE', 'ServiceRequests')
 table = dynamodb.Table(table_name)
 
+def _json_default(obj):
+    if isinstance(obj, Decimal):
+        return float(obj)
+    return str(obj)
+
+def dumps(obj) -> str:
+    return orjson.dumps(obj, default=_json_default).decode()
+
 def handler(event, context):
     try:
-        # Scan the entire table (be careful if large)
-        response = table.scan()
-        items = response.get('Items', [])
+        # Scan with pagination, projecting only the attributes the UI needs
+        scan_kwargs = {
+            'ProjectionExpression': (
+                'serviceId, customerName, customerPhone, customerEmail, '
+                'serviceType, description, requestedAt, #status, assignedTechnician'
+            ),
+            'ExpressionAttributeNames': {'#status': 'status'}
+        }
+
+        items = []
+        while True:
+            response = table.scan(**scan_kwargs)
+            items.extend(response.get('Items', []))
+            last_key = response.get('LastEvaluatedKey')
+            if not last_key:
+                break
+            scan_kwargs['ExclusiveStartKey'] = last_key
 
         return {
             'statusCode': 200,
             'headers': {'Content-Type': 'application/json'},
-            'body': json.dumps({
+            'body': dumps({
                 'message': 'Service requests retrieved successfully',
                 'data': items
             })
@@ -28,7 +49,7 @@ def handler(event, context):
         return {
             'statusCode': 500,
             'headers': {'Content-Type': 'application/json'},
-            'body': json.dumps({
+            'body': dumps({
                 'message': 'Failed to retrieve service requests',
                 'error': str(e)
             })
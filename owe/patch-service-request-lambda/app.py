@@ -2,7 +2,6 @@ import json
 import boto3
 import os
 from boto3.dynamodb.conditions import Key
-from datetime import datetime
 
 dynamodb = boto3.resource('dynamodb')
 table = dynamodb.Table(os.environ.get('DYNAMODB_TABLE', 'ServiceRequests'))
@@ -30,31 +29,26 @@ def handler(event, context):
         item = response['Items'][0]
         sk = item['SK']
 
-        # Update expression and attribute values
-        update_fields = []
-        expression_values = {}
-
-        for key, value in body.items():
-            update_fields.append(f"{key} = :{key}")
-            expression_values[f":{key}"] = value
-
-        if not update_fields:
+        # Build placeholder maps so reserved attribute names (e.g. status)
+        # are always aliased instead of failing the update
+        update_keys = list(body)
+        if not update_keys:
             return {
                 "statusCode": 400,
                 "body": json.dumps({"success": False, "message": "No fields to update"})
             }
 
-        update_expr = "SET " + ", ".join(update_fields)
+        names = {f"#k{i}": key for i, key in enumerate(update_keys)}
+        values = {f":v{i}": body[key] for i, key in enumerate(update_keys)}
+        update_expr = "SET " + ", ".join(
+            f"#k{i} = :v{i}" for i in range(len(update_keys))
+        )
 
         table.update_item(
             Key={'PK': pk, 'SK': sk},
-            UpdateExpression="SET #status = :status",
-            ExpressionAttributeNames={
-                "#status": "status"
-            },
-            ExpressionAttributeValues={
-                ":status": body["status"]  # or body["status"]
-            }
+            UpdateExpression=update_expr,
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=values
         )
 
 
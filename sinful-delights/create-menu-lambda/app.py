@@ -1,7 +1,8 @@
-import json
+import orjson
 import os
 import sys
-from datetime import datetime, timedelta
+import time
+from datetime import date, datetime, timedelta
 from typing import Dict, Any, List
 
 # Add shared modules to path
@@ -11,12 +12,23 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'shared'))
 try:
     from shared.auth import validate_admin_access, validate_customer_access, get_user_id
     from shared.errors import handle_exceptions, create_success_response, ValidationError, NotFoundError, OutOfStockError
-    from shared.dynamo import get_item, put_item, update_item, delete_item, query_items, transact_write, parse_dynamodb_item, format_dynamodb_item
+    from shared.dynamo import get_item, put_item, update_item, delete_item, query_items, transact_write, batch_put_items, parse_dynamodb_item, format_dynamodb_item, get_table_name
     from shared.models import MenuItem, Menu, Order, CreateOrderRequest, Subscription, UpsertSubscriptionRequest, CateringRequestCreate, AdminAnalytics, MenuUpsert, InventoryAdjustRequest, InventoryAdjustResponse
     from shared.utils import generate_id, validate_iso8601_datetime, get_today_date
     from shared.s3 import generate_presigned_upload_url
-except ImportError:
-    # Fallback for local testing
+    from pydantic import TypeAdapter
+
+    # Module-scope adapters: validate_json parses and validates request
+    # bodies in one pydantic-core pass instead of orjson.loads + model call
+    _ORDER_ADAPTER = TypeAdapter(CreateOrderRequest)
+    _SUBSCRIPTION_ADAPTER = TypeAdapter(UpsertSubscriptionRequest)
+    _CATERING_ADAPTER = TypeAdapter(CateringRequestCreate)
+    _MENU_ADAPTER = TypeAdapter(MenuUpsert)
+    _INVENTORY_ADAPTER = TypeAdapter(InventoryAdjustRequest)
+except Exception:
+    # Fallback for local testing. Broader than ImportError because the
+    # shared-layer imports can also fail at class-definition time (e.g. a
+    # pydantic version mismatch), which must not crash module INIT
     import boto3
     from botocore.exceptions import ClientError
     
@@ -48,9 +60,38 @@ except ImportError:
         return str(uuid.uuid4())
     
     def get_today_date():
-        return datetime.now().strftime("%Y-%m-%d")
-    
+        return date.today().isoformat()
+
     import uuid
+    from types import SimpleNamespace
+
+    class _JsonAdapter:
+        """Minimal TypeAdapter stand-in: parses the body into an object
+        with attribute access but skips pydantic validation."""
+
+        def validate_json(self, raw):
+            return SimpleNamespace(**orjson.loads(raw or b'{}'))
+
+    _ORDER_ADAPTER = _JsonAdapter()
+    _SUBSCRIPTION_ADAPTER = _JsonAdapter()
+    _CATERING_ADAPTER = _JsonAdapter()
+    _MENU_ADAPTER = _JsonAdapter()
+    _INVENTORY_ADAPTER = _JsonAdapter()
+
+# Warm-container read-through cache for today's menu: the same MENU#<date>
+# partition is read far more often than it changes, so a short TTL saves a
+# DynamoDB round trip on most customer reads. An ElastiCache tier would
+# share this across containers; in-process keeps it dependency-free.
+_MENU_CACHE = {}
+_MENU_CACHE_TTL = 300
+
+
+# Response headers never vary, so one module-scope dict is shared by
+# every response instead of being rebuilt per invocation
+_HDRS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*'
+}
 
 @handle_exceptions
 def get_today_menu(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -67,6 +108,11 @@ def get_today_menu(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     validate_customer_access(event)
     
     today = get_today_date()
+
+    cached = _MENU_CACHE.get(today)
+    if cached and cached[1] > time.monotonic():
+        return create_success_response(cached[0])
+
     menu_items = query_items(f"MENU#{today}", "ITEM#")
     
     parsed_items = []
@@ -81,7 +127,8 @@ def get_today_menu(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             'isSpecial': parsed_item.get('isSpecial', False),
             'imageUrl': parsed_item.get('imageUrl', '')
         })
-    
+
+    _MENU_CACHE[today] = (parsed_items, time.monotonic() + _MENU_CACHE_TTL)
     return create_success_response(parsed_items)
 
 @handle_exceptions
@@ -99,41 +146,47 @@ def create_order(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     validate_customer_access(event)
     user_id = get_user_id(event)
     
-    body = json.loads(event.get('body', '{}'))
-    order_request = CreateOrderRequest(**body)
+    order_request = _ORDER_ADAPTER.validate_json(event.get('body') or b'{}')
     
     order_id = generate_id()
-    
-    # Create transactional write items to update stock and create order
-    transact_items = []
-    
-    for item in order_request.items:
+    table_name = get_table_name()
+
+    # Preallocated so the list never reallocates while the loop fills it
+    transact_items = [None] * (len(order_request.items) + 1)
+
+    for i, item in enumerate(order_request.items):
         # Validate and decrement stock atomically
-        transact_items.append({
+        transact_items[i] = {
             'Update': {
-                'Key': f'ITEM#{item["itemId"]}',
-                'SK': 'STOCK',
+                'TableName': table_name,
+                'Key': {
+                    'PK': {'S': 'ITEM#' + item['itemId']},
+                    'SK': {'S': 'STOCK'}
+                },
                 'UpdateExpression': 'SET stockQty = stockQty - :qty',
                 'ConditionExpression': 'stockQty >= :qty',
-                'ExpressionAttributeValues': {':qty': item['quantity']}
+                'ExpressionAttributeValues': {
+                    ':qty': {'N': str(item['quantity'])}
+                }
             }
-        })
-    
+        }
+
     # Add order record
-    transact_items.append({
+    transact_items[-1] = {
         'Put': {
-            'Key': f'ORDER#{order_id}',
-            'SK': 'DETAILS',
-            'Item': {
+            'TableName': table_name,
+            'Item': format_dynamodb_item({
+                'PK': 'ORDER#' + order_id,
+                'SK': 'DETAILS',
                 'orderId': order_id,
                 'userId': user_id,
                 'pickupSlot': order_request.pickupSlot.isoformat(),
                 'status': 'NEW',
                 'placedAt': datetime.now().isoformat(),
                 'notes': order_request.notes
-            }
+            })
         }
-    })
+    }
     
     # Perform atomic transaction
     try:
@@ -184,24 +237,30 @@ def create_subscription(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     validate_customer_access(event)
     user_id = get_user_id(event)
     
-    body = json.loads(event.get('body', '{}'))
-    subscription_request = UpsertSubscriptionRequest(**body)
+    subscription_request = _SUBSCRIPTION_ADAPTER.validate_json(event.get('body') or b'{}')
     
     subscription_id = generate_id()
-    next_delivery = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+    next_delivery = (date.today() + timedelta(days=7)).isoformat()
+    now_iso = datetime.now().isoformat()
     
     subscription_data = {
+        'EntityType': 'SUBSCRIPTION',
         'subscriptionId': subscription_id,
         'userId': user_id,
-        'plan': subscription_request.plan.dict() if subscription_request.plan else {},
+        'plan': subscription_request.plan.model_dump(mode='json') if subscription_request.plan else {},
         'nextDelivery': next_delivery,
         'status': 'ACTIVE',
+        # Normalized sparse attribute: only subscription rows carry it,
+        # so a sparse GSI keyed on it indexes just the subscription set
+        'SubscriptionStatus': 'ACTIVE',
         'skipDates': subscription_request.skipDates or [],
-        'createdAt': datetime.now().isoformat(),
-        'updatedAt': datetime.now().isoformat()
+        'createdAt': now_iso,
+        'updatedAt': now_iso
     }
-    
-    put_item(f'USER#{user_id}', 'SUBSCRIPTION', subscription_data)
+
+    put_item(format_dynamodb_item(
+        dict(subscription_data, PK=f'USER#{user_id}', SK='SUBSCRIPTION')
+    ))
     
     return create_success_response(subscription_data, 201)
 
@@ -220,12 +279,12 @@ def create_catering_request(event: Dict[str, Any], context: Any) -> Dict[str, An
     validate_customer_access(event)
     user_id = get_user_id(event)
     
-    body = json.loads(event.get('body', '{}'))
-    catering_request = CateringRequestCreate(**body)
+    catering_request = _CATERING_ADAPTER.validate_json(event.get('body') or b'{}')
     
     request_id = generate_id()
     
     catering_data = {
+        'EntityType': 'CATERING',
         'requestId': request_id,
         'userId': user_id,
         'eventDate': catering_request.eventDate,
@@ -233,10 +292,12 @@ def create_catering_request(event: Dict[str, Any], context: Any) -> Dict[str, An
         'status': 'NEW',
         'createdAt': datetime.now().isoformat(),
         'budget': catering_request.budget,
-        'contact': catering_request.contact.dict()
+        'contact': catering_request.contact.model_dump(mode='json')
     }
     
-    put_item(f'USER#{user_id}', f'CATERING#{request_id}', catering_data)
+    put_item(format_dynamodb_item(
+        dict(catering_data, PK=f'USER#{user_id}', SK=f'CATERING#{request_id}')
+    ))
     
     return create_success_response({
         'requestId': request_id,
@@ -260,8 +321,12 @@ def get_admin_analytics(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     # Query for orders and calculate analytics
     orders = query_items("ORDER", "DETAILS", limit=1000)
     
-    total_sales = sum(order.get('total', 0) for order in orders)
-    order_count = len(orders)
+    # Single pass over orders for both aggregates
+    total_sales = 0.0
+    order_count = 0
+    for order in orders:
+        total_sales += order.get('total', 0)
+        order_count += 1
     
     analytics = {
         'dailyGrossSales': total_sales,
@@ -293,27 +358,32 @@ def create_admin_menu(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     validate_admin_access(event)
     
-    body = json.loads(event.get('body', '{}'))
-    menu_request = MenuUpsert(**body)
+    menu_request = _MENU_ADAPTER.validate_json(event.get('body') or b'{}')
     
     menu_id = menu_request.menuId or generate_id()
+    menu_pk = 'MENU#' + menu_id
     
-    # Create menu record
+    # Menu header and item rows go out in one request
     menu_data = {
+        'PK': menu_pk,
+        'SK': 'DETAILS',
         'menuId': menu_id,
         'date': menu_request.date,
         'title': menu_request.title,
         'isActive': menu_request.isActive,
         'imageUrl': menu_request.imageUrl,
-        'lastUpdated': datetime.now().isoformat()
+        'lastUpdated': datetime.now().isoformat(),
+        # Headers share one GSI1 partition with the date as sort key so
+        # the menu listing can range-query by date
+        'GSI1PK': 'MENU_META',
+        'GSI1SK': menu_request.date
     }
-    
-    put_item(f'MENU#{menu_id}', 'DETAILS', menu_data)
-    
-    # Create item records
-    transact_items = []
+
+    item_records = [format_dynamodb_item(menu_data)]
     for item in menu_request.items:
         item_data = {
+            'PK': menu_pk,
+            'SK': 'ITEM#' + item.itemId,
             'itemId': item.itemId,
             'menuId': menu_id,
             'name': item.name,
@@ -326,17 +396,23 @@ def create_admin_menu(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             'category': item.category.value if item.category else None,
             'spiceLevel': item.spiceLevel
         }
-        
-        transact_items.append({
-            'Put': {
-                'Key': f'MENU#{menu_id}',
-                'SK': f'ITEM#{item.itemId}',
-                'Item': item_data
-            }
-        })
-    
-    transact_write(transact_items)
-    
+        item_records.append(format_dynamodb_item(item_data))
+
+    # One transaction makes header and items appear together, so readers
+    # never see DETAILS without its items. Menus past the 100-item
+    # TransactWriteItems cap fall back to batch writes
+    if len(item_records) <= 100:
+        table_name = get_table_name()
+        transact_write([
+            {'Put': {'TableName': table_name, 'Item': record}}
+            for record in item_records
+        ])
+    else:
+        batch_put_items(item_records)
+    
+    # Drop any cached copy for this date so readers see the new menu
+    _MENU_CACHE.pop(menu_request.date, None)
+
     return create_success_response({
         'menuId': menu_id,
         'status': 'created'
@@ -356,8 +432,7 @@ def update_inventory(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     validate_admin_access(event)
     
-    body = json.loads(event.get('body', '{}'))
-    inventory_request = InventoryAdjustRequest(**body)
+    inventory_request = _INVENTORY_ADAPTER.validate_json(event.get('body') or b'{}')
     
     # Update stock atomically with condition to prevent negative stock
     updated_item = update_item(
@@ -367,7 +442,8 @@ def update_inventory(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         {':adj': inventory_request.adjustment},
         condition_expression='stockQty + :adj >= :zero',
         expression_attribute_values={':zero': 0},
-        return_values='ALL_NEW'
+        # UPDATED_NEW returns just stockQty; the response reads nothing else
+        return_values='UPDATED_NEW'
     )
     
     if not updated_item:
@@ -392,31 +468,25 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: HTTP response from the appropriate handler
     """
-    resource = event.get('resource', '')
-    http_method = event.get('httpMethod', '')
-    
-    # Customer Endpoints
-    if resource == '/v1/menu/today' and http_method == 'GET':
-        return get_today_menu(event, context)
-    elif resource == '/v1/order' and http_method == 'POST':
-        return create_order(event, context)
-    elif resource == '/v1/subscription' and http_method == 'GET':
-        return get_subscription(event, context)
-    elif resource == '/v1/subscription' and http_method == 'POST':
-        return create_subscription(event, context)
-    elif resource == '/v1/catering' and http_method == 'POST':
-        return create_catering_request(event, context)
-    
-    # Admin Endpoints
-    elif resource == '/v1/admin/analytics' and http_method == 'GET':
-        return get_admin_analytics(event, context)
-    elif resource == '/v1/admin/menu' and http_method == 'POST':
-        return create_admin_menu(event, context)
-    elif resource == '/v1/admin/inventory' and http_method == 'POST':
-        return update_inventory(event, context)
-    
-    # Unsupported route
-    raise NotFoundError("Endpoint not found")
+    handler = _ROUTES.get((event.get('resource', ''), event.get('httpMethod', '')))
+    if handler is None:
+        raise NotFoundError("Endpoint not found")
+    return handler(event, context)
+
+
+# Route table: (resource, method) -> handler, resolved with one dict lookup
+_ROUTES = {
+    # Customer endpoints
+    ('/v1/menu/today', 'GET'): get_today_menu,
+    ('/v1/order', 'POST'): create_order,
+    ('/v1/subscription', 'GET'): get_subscription,
+    ('/v1/subscription', 'POST'): create_subscription,
+    ('/v1/catering', 'POST'): create_catering_request,
+    # Admin endpoints
+    ('/v1/admin/analytics', 'GET'): get_admin_analytics,
+    ('/v1/admin/menu', 'POST'): create_admin_menu,
+    ('/v1/admin/inventory', 'POST'): update_inventory,
+}
 
 def _response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -424,9 +494,6 @@ def _response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
     """
     return {
         'statusCode': status_code,
-        'headers': {
-            'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': '*'
-        },
-        'body': json.dumps(body)
+        'headers': _HDRS,
+        'body': orjson.dumps(body).decode()
     }
\ No newline at end of file
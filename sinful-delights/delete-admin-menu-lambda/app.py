@@ -1,6 +1,7 @@
-import json
+import orjson
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 
 # Add shared modules to path
@@ -10,7 +11,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'shared'))
 try:
     from shared.auth import validate_admin_access
     from shared.errors import handle_exceptions, create_success_response, NotFoundError, ValidationError
-    from shared.dynamo import get_item, delete_item, query_items, transact_write
+    from shared.dynamo import delete_item, query_pages, batch_delete_items
 except ImportError:
     # Fallback for local testing
     import boto3
@@ -34,6 +35,13 @@ except ImportError:
     def create_success_response(data, status_code=200):
         return _response(status_code, data)
 
+# Response headers never vary, so one module-scope dict is shared by
+# every response instead of being rebuilt per invocation
+_HDRS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*'
+}
+
 @handle_exceptions
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -53,48 +61,36 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     if not menu_id:
         raise ValidationError("Missing menu ID")
     
-    # Check if menu exists
-    menu_item = get_item(f'MENU#{menu_id}', 'DETAILS')
-    if not menu_item:
+    # Stream item pages and delete as each arrives, so huge menus never
+    # hit the 1MB single-query cap or accumulate all keys in memory.
+    # Deletions are independent, so BatchWriteItem replaces the
+    # transaction: 1x WCU per item and no 25-item all-or-nothing window
+    menu_pk = f'MENU#{menu_id}'
+    pk_av = {'S': menu_pk}
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # Submitting per page lets the next page fetch proceed while
+        # earlier pages are still being deleted
+        futures = [
+            executor.submit(
+                batch_delete_items,
+                [{'PK': pk_av, 'SK': item['SK']} for item in page]
+            )
+            for page in query_pages(menu_pk, 'ITEM#', ProjectionExpression='SK')
+        ]
+        for future in futures:
+            future.result()
+
+    # The conditional delete on DETAILS doubles as the existence check,
+    # saving the up-front GetItem round trip on every delete
+    if not delete_item(menu_pk, 'DETAILS', condition_expression='attribute_exists(PK)'):
         raise NotFoundError("Menu not found")
     
-    # Get all menu items
-    menu_items = query_items(f'MENU#{menu_id}', 'ITEM#')
-    
-    # Prepare delete requests
-    delete_requests = []
-    
-    # Add menu items to delete request
-    for item in menu_items:
-        delete_requests.append({
-            'Delete': {
-                'Key': f'MENU#{menu_id}',
-                'SK': f'ITEM#{item.get("itemId", item.get("ItemId", "")}}'
-            }
-        })
-    
-    # Add menu details to delete request
-    delete_requests.append({
-        'Delete': {
-            'Key': f'MENU#{menu_id}',
-            'SK': 'DETAILS'
-        }
-    })
-    
-    # Execute batch delete in chunks
-    for i in range(0, len(delete_requests), 25):
-        batch = delete_requests[i:i+25]
-        transact_write(batch)
-    
     return create_success_response({'status': 'DELETED'})
 
 def _response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
     """Fallback response formatter for local testing."""
     return {
         'statusCode': status_code,
-        'headers': {
-            'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': '*'
-        },
-        'body': json.dumps(body)
+        'headers': _HDRS,
+        'body': orjson.dumps(body, default=str).decode()
     }
\ No newline at end of file
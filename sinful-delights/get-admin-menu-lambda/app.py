@@ -1,4 +1,4 @@
-import json
+import orjson
 import os
 import sys
 from typing import Dict, Any
@@ -35,6 +35,13 @@ except ImportError:
     def create_success_response(data, status_code=200):
         return _response(status_code, data)
 
+# Response headers never vary, so one module-scope dict is shared by
+# every response instead of being rebuilt per invocation
+_HDRS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*'
+}
+
 @handle_exceptions
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -54,17 +61,26 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     if not menu_id:
         raise ValidationError("Missing menu ID")
     
-    # Get menu details
-    menu_item = get_item(f'MENU#{menu_id}', 'DETAILS')
+    # One unprefixed query fetches the DETAILS row and every ITEM# row in
+    # a single round trip; rows are classified by SK prefix here instead
+    # of paying a separate GetItem for the header
+    menu_rows = query_items(f'MENU#{menu_id}')
+
+    menu_item = None
+    menu_items = []
+    for row in menu_rows:
+        sk = row.get('SK', {}).get('S', '')
+        if sk == 'DETAILS':
+            menu_item = row
+        elif sk.startswith('ITEM#'):
+            menu_items.append(row)
+
     if not menu_item:
         raise NotFoundError("Menu not found")
-    
-    # Get menu items
-    menu_items = query_items(f'MENU#{menu_id}', 'ITEM#')
-    
+
     # Parse menu details
     menu_data = parse_dynamodb_item(menu_item)
-    
+
     # Parse menu items
     items = []
     for item in menu_items:
@@ -98,9 +114,6 @@ def _response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
     """Fallback response formatter for local testing."""
     return {
         'statusCode': status_code,
-        'headers': {
-            'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': '*'
-        },
-        'body': json.dumps(body)
+        'headers': _HDRS,
+        'body': orjson.dumps(body, default=str).decode()
     }
\ No newline at end of file
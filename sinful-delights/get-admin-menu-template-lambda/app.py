@@ -1,23 +1,39 @@
 import json
 import os
 import boto3
+from botocore.config import Config
 from typing import Dict, Any
 
 # DynamoDB configuration
 TABLE_NAME = os.environ["TABLE_NAME"]
-dynamodb = boto3.client("dynamodb")
+dynamodb = boto3.client(
+    "dynamodb",
+    config=Config(max_pool_connections=16, retries={"mode": "adaptive"},
+                  tcp_keepalive=True)
+)
+
+# The 401 envelope never varies, so it is built once at module scope and
+# returned as-is instead of re-allocating dicts and re-serializing the
+# body on every rejected request
+_UNAUTHORIZED = {
+    'statusCode': 401,
+    'headers': {
+        'Content-Type': 'application/json',
+        'Access-Control-Allow-Origin': '*'
+    },
+    'body': '{"error": "Unauthorized"}'
+}
 
 def validate_api_key(event: Dict[str, Any]) -> bool:
     """Validate the API key from the event headers."""
-    return 'X-API-Key' in event.get('headers', {})
+    return (event.get('headers') or {}).get('X-API-Key') is not None
 
 def validate_admin_token(event: Dict[str, Any]) -> bool:
     """Validate admin Firebase Auth ID token."""
-    try:
-        claims = event['requestContext']['authorizer']['claims']
-        return claims.get('role') == 'admin'
-    except:
-        return False
+    # Plain .get chain: no exception-frame setup on the hot path
+    claims = ((event.get('requestContext') or {})
+              .get('authorizer', {}).get('claims', {}))
+    return claims.get('role') == 'admin'
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -32,14 +48,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     # Validate API key and admin token
     if not validate_api_key(event) or not validate_admin_token(event):
-        return {
-            'statusCode': 401,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({'error': 'Unauthorized'})
-        }
+        return _UNAUTHORIZED
     
     try:
         # Get template ID from path parameters
@@ -60,7 +69,11 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             Key={
                 'PK': {'S': f'TEMPLATE#{template_id}'},
                 'SK': {'S': 'DETAILS'}
-            }
+            },
+            # The response only uses the template name; 'Name' is a
+            # reserved word so it needs a placeholder
+            ProjectionExpression='#n',
+            ExpressionAttributeNames={'#n': 'Name'}
         )
         
         if 'Item' not in template_response:
@@ -82,7 +95,9 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             ExpressionAttributeValues={
                 ':pk': {'S': f'TEMPLATE#{template_id}'},
                 ':item': {'S': 'ITEM#'}
-            }
+            },
+            ProjectionExpression='#n, Description, Price, StockQty, IsSpecial',
+            ExpressionAttributeNames={'#n': 'Name'}
         )
         
         items = []
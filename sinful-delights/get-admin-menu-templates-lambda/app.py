@@ -1,23 +1,47 @@
 import json
 import os
 import boto3
+from botocore.config import Config
 from typing import Dict, Any
 
 # DynamoDB configuration
 TABLE_NAME = os.environ["TABLE_NAME"]
-dynamodb = boto3.client("dynamodb")
+dynamodb = boto3.client(
+    "dynamodb",
+    config=Config(max_pool_connections=16, retries={"mode": "adaptive"},
+                  tcp_keepalive=True)
+)
+
+# The 401 envelope never varies, so it is built once at module scope and
+# returned as-is instead of re-allocating dicts and re-serializing the
+# body on every rejected request
+_UNAUTHORIZED = {
+    'statusCode': 401,
+    'headers': {
+        'Content-Type': 'application/json',
+        'Access-Control-Allow-Origin': '*'
+    },
+    'body': '{"error": "Unauthorized"}'
+}
 
 def validate_api_key(event: Dict[str, Any]) -> bool:
     """Validate the API key from the event headers."""
-    return 'X-API-Key' in event.get('headers', {})
+    return (event.get('headers') or {}).get('X-API-Key') is not None
 
 def validate_admin_token(event: Dict[str, Any]) -> bool:
     """Validate admin Firebase Auth ID token."""
-    try:
-        claims = event['requestContext']['authorizer']['claims']
-        return claims.get('role') == 'admin'
-    except:
-        return False
+    # Plain .get chain: no exception-frame setup on the hot path
+    claims = ((event.get('requestContext') or {})
+              .get('authorizer', {}).get('claims', {}))
+    return claims.get('role') == 'admin'
+
+# Constant request fragments shared across invocations; boto3 never
+# mutates them
+_QUERY_VALUES = {
+    ':type': {'S': 'TEMPLATE'},
+    ':d': {'S': 'DETAILS'}
+}
+_NAME_PLACEHOLDER = {'#n': 'Name'}
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -32,14 +56,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     # Validate API key and admin token
     if not validate_api_key(event) or not validate_admin_token(event):
-        return {
-            'statusCode': 401,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({'error': 'Unauthorized'})
-        }
+        return _UNAUTHORIZED
     
     try:
         # Query DynamoDB for all templates
@@ -47,17 +64,23 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             TableName=TABLE_NAME,
             IndexName='TemplateIndex',
             KeyConditionExpression='EntityType = :type',
-            ExpressionAttributeValues={':type': {'S': 'TEMPLATE'}}
+            # The DETAILS predicate runs server-side, so non-header rows
+            # never cross the wire; only the three emitted fields are
+            # projected ('Name' is a reserved word)
+            FilterExpression='SK = :d',
+            ExpressionAttributeValues=_QUERY_VALUES,
+            ProjectionExpression='TemplateId, #n, CreatedAt',
+            ExpressionAttributeNames=_NAME_PLACEHOLDER
         )
-        
-        templates = []
-        for item in response.get('Items', []):
-            if item.get('SK', {}).get('S') == 'DETAILS':
-                templates.append({
-                    'templateId': item.get('TemplateId', {}).get('S', ''),
-                    'name': item.get('Name', {}).get('S', ''),
-                    'createdAt': item.get('CreatedAt', {}).get('S', '')
-                })
+
+        templates = [
+            {
+                'templateId': item.get('TemplateId', {}).get('S', ''),
+                'name': item.get('Name', {}).get('S', ''),
+                'createdAt': item.get('CreatedAt', {}).get('S', '')
+            }
+            for item in response.get('Items', [])
+        ]
         
         return {
             'statusCode': 200,
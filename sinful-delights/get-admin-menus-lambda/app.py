@@ -1,6 +1,8 @@
+import base64
 import json
 import os
 import sys
+import time
 from typing import Dict, Any
 
 # Add shared modules to path
@@ -10,7 +12,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'shared'))
 try:
     from shared.auth import validate_admin_access
     from shared.errors import handle_exceptions, create_success_response, ValidationError
-    from shared.dynamo import scan_with_filter, parse_dynamodb_item
+    from shared.dynamo import query_index_page, count_index_items, parse_dynamodb_item
     from shared.utils import validate_date_format, parse_pagination_params
 except ImportError:
     # Fallback for local testing
@@ -49,9 +51,11 @@ except ImportError:
             'body': json.dumps(data)
         }
     
+    import re
+    _DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
     def validate_date_format(date_str):
-        import re
-        return bool(re.match(r'^\d{4}-\d{2}-\d{2}$', date_str))
+        return _DATE_RE.match(date_str) is not None
     
     def parse_pagination_params(event):
         params = event.get('queryStringParameters') or {}
@@ -59,6 +63,19 @@ except ImportError:
         limit = max(1, min(200, int(params.get('limit', 50))))
         return page, limit
 
+# Constant request fragments, hoisted so the warm path passes shared
+# references instead of rebuilding the same dicts per invocation
+_HEADER_KEY_CONDITION = 'GSI1PK = :pk AND GSI1SK BETWEEN :f AND :t'
+_HEADER_PROJECTION = 'PK, #d, title, isActive'
+_HEADER_NAMES = {'#d': 'date'}
+
+# Warm-container cache keyed by the full filter tuple: the admin listing
+# changes rarely, so repeat invocations with the same filters in the same
+# container skip the DynamoDB query. No in-module writer can invalidate
+# it, so the TTL is kept short (tunable via MENU_CACHE_TTL)
+_MENU_LIST_CACHE = {}
+_MENU_LIST_CACHE_TTL = int(os.environ.get('MENU_CACHE_TTL', '30'))
+
 @handle_exceptions
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -80,47 +97,77 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     
     if to_date and not validate_date_format(to_date):
         raise ValidationError("Invalid 'to' date format (YYYY-MM-DD required)")
-    
-    # Scan for all menu headers using shared utility
-    items = scan_with_filter('SK = :sk', {':sk': {'S': 'META'}})
-    
-    # Parse and filter menu data
-    menus = []
-    for item in items:
-        parsed_item = parse_dynamodb_item(item)
-        menu_id = parsed_item.get('PK', '').replace('MENU#', '')
-        menu_data = {
-            'menuId': menu_id,
-            'date': parsed_item.get('date', ''),
-            'title': parsed_item.get('title', ''),
-            'isActive': parsed_item.get('isActive', True)
+
+    next_token = query_params.get('nextToken')
+    cache_key = (from_date, to_date, active_filter, next_token, limit)
+    cached = _MENU_LIST_CACHE.get(cache_key)
+    if cached and cached[1] > time.monotonic():
+        return create_success_response(cached[0])
+
+    # Menu headers share the MENU_META partition of GSI1 with the date
+    # as sort key, so the date window is a key condition: DynamoDB reads
+    # only the matching headers instead of scanning the table. Limit
+    # bounds the page and the continuation key round-trips to the client
+    # as an opaque nextToken
+    query_kwargs = {
+        'ProjectionExpression': _HEADER_PROJECTION,
+        'ExpressionAttributeNames': _HEADER_NAMES,
+        'Limit': limit
+    }
+    if next_token:
+        try:
+            query_kwargs['ExclusiveStartKey'] = json.loads(base64.b64decode(next_token))
+        except Exception:
+            raise ValidationError("Invalid nextToken")
+    expression_values = {
+        ':pk': {'S': 'MENU_META'},
+        ':f': {'S': from_date or '0000-01-01'},
+        ':t': {'S': to_date or '9999-12-31'}
+    }
+    # The active filter also runs server-side, so filtered-out headers
+    # never cross the wire
+    if active_filter is not None:
+        query_kwargs['FilterExpression'] = 'isActive = :a'
+        expression_values[':a'] = {'BOOL': active_filter.lower() == 'true'}
+    items, last_key = query_index_page(
+        'GSI1', _HEADER_KEY_CONDITION, expression_values, **query_kwargs
+    )
+
+    # total reflects every menu matching the filters, not just this page:
+    # a Select=COUNT query returns per-page counts with no item bytes
+    count_kwargs = {}
+    if 'FilterExpression' in query_kwargs:
+        count_kwargs['FilterExpression'] = query_kwargs['FilterExpression']
+    total = count_index_items(
+        'GSI1', _HEADER_KEY_CONDITION, expression_values, **count_kwargs
+    )
+
+    # Parse menu data; the date window and active filter were already
+    # applied server-side
+    menus = [
+        {
+            'menuId': parsed.get('PK', '').replace('MENU#', ''),
+            'date': parsed.get('date', ''),
+            'title': parsed.get('title', ''),
+            'isActive': parsed.get('isActive', True)
         }
-        
-        # Apply date filters
-        if from_date and menu_data['date'] < from_date:
-            continue
-        if to_date and menu_data['date'] > to_date:
-            continue
-        
-        # Apply active filter
-        if active_filter is not None:
-            is_active = active_filter.lower() == 'true'
-            if menu_data['isActive'] != is_active:
-                continue
-        
-        menus.append(menu_data)
-    
-    # Apply pagination
-    total = len(menus)
-    start_idx = (page - 1) * limit
-    end_idx = start_idx + limit
-    paginated_menus = menus[start_idx:end_idx]
+        for parsed in map(parse_dynamodb_item, items)
+    ]
     
+    # Server-side Limit already bounds the page, so the result ships
+    # as-is; the token lets clients continue where this page stopped
     response_data = {
         'page': page,
         'limit': limit,
         'total': total,
-        'data': paginated_menus
+        'data': menus,
+        'nextToken': (
+            base64.b64encode(json.dumps(last_key).encode()).decode()
+            if last_key else None
+        )
     }
-    
+
+    _MENU_LIST_CACHE[cache_key] = (
+        response_data, time.monotonic() + _MENU_LIST_CACHE_TTL
+    )
     return create_success_response(response_data)
\ No newline at end of file
@@ -43,9 +43,11 @@ except ImportError:
     class ValidationError(Exception):
         pass
     
+    import re
+    _DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
     def validate_date_format(date_str):
-        import re
-        return bool(re.match(r"^\d{4}-\d{2}-\d{2}$", date_str))
+        return _DATE_RE.match(date_str) is not None
     
     def extract_path_params(event):
         return event.get('pathParameters') or {}
@@ -78,8 +80,20 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     try:
         from shared.dynamo import query_items, parse_dynamodb_item
         
-        menu_items = query_items(f"MENU#{date}", "ITEM#")
-        
+        # One unprefixed query returns the DETAILS header and the ITEM#
+        # rows together; only the attributes the response emits are
+        # projected, so transferred bytes and parse work scale with what
+        # is used rather than full row width ('name' is a reserved word)
+        menu_items = query_items(
+            f"MENU#{date}",
+            ProjectionExpression=(
+                'SK, itemId, menuId, #n, description, price, stockQty, '
+                'imageUrl, isSpecial, category, spiceLevel, available, '
+                'title, isActive, lastUpdated'
+            ),
+            ExpressionAttributeNames={'#n': 'name'}
+        )
+
         if not menu_items:
             raise NotFoundError(f"No menu found for date {date}")
         
@@ -108,7 +122,10 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             elif parsed.get('SK') == 'DETAILS':
                 # This is the menu metadata
                 menu_data = parsed
-        
+
+        if menu_data is None:
+            menu_data = {}
+
         # Construct menu response according to OpenAPI spec
         menu_response = {
             'menuId': menu_data.get('menuId', str(uuid.uuid4())),
@@ -123,9 +140,8 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         return create_success_response(menu_response)
         
     except ImportError:
-        # Fallback to direct DynamoDB calls for local testing
-        import boto3
-        dynamodb = boto3.client("dynamodb")
+        # Fallback to direct DynamoDB calls for local testing; reuses the
+        # module-level client created during INIT
         
         response = dynamodb.query(
             TableName=TABLE_NAME,
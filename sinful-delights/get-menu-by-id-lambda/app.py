@@ -113,9 +113,8 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         return create_success_response(menu_response)
         
     except ImportError:
-        # Fallback to direct DynamoDB calls for local testing
-        import boto3
-        dynamodb = boto3.client("dynamodb")
+        # Fallback to direct DynamoDB calls for local testing; reuses the
+        # module-level client created during INIT
         
         # Try to find menu by scanning (not optimal but fallback)
         response = dynamodb.scan(
@@ -1,8 +1,9 @@
 import json
 import os
 import sys
+import time
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 from typing import Dict, Any
 
 # Add shared modules to path
@@ -38,10 +39,16 @@ except ImportError:
         pass
     
     def get_today_date():
-        return datetime.now().strftime("%Y-%m-%d")
+        return date.today().isoformat()
 
 TABLE_NAME = os.environ.get("TABLE_NAME", "sinful-delights-table")
 
+# Warm-container cache: today's menu is read-heavy and changes rarely, so
+# repeat invocations in the same container skip the DynamoDB query. No
+# in-module writer can invalidate it, so the TTL is kept short
+_MENU_CACHE = {}
+_MENU_CACHE_TTL = 60
+
 @handle_exceptions
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -53,13 +60,28 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     validate_customer_access(event)
     
     today = get_today_date()
-    
+
+    cached = _MENU_CACHE.get(today)
+    if cached and cached[1] > time.monotonic():
+        return create_success_response(cached[0])
+
     # Query for today's active menu
     try:
         from shared.dynamo import query_items, parse_dynamodb_item
         
-        menu_items = query_items(f"MENU#{today}", "ITEM#")
-        
+        # One unprefixed query returns the DETAILS header and the ITEM#
+        # rows together; only the attributes the response emits are
+        # projected ('name' is a reserved word)
+        menu_items = query_items(
+            f"MENU#{today}",
+            ProjectionExpression=(
+                'SK, itemId, menuId, #n, description, price, stockQty, '
+                'imageUrl, isSpecial, category, spiceLevel, available, '
+                'title, isActive, lastUpdated'
+            ),
+            ExpressionAttributeNames={'#n': 'name'}
+        )
+
         if not menu_items:
             raise NotFoundError("No menu found for today")
         
@@ -88,7 +110,10 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             elif parsed.get('SK') == 'DETAILS':
                 # This is the menu metadata
                 menu_data = parsed
-        
+
+        if menu_data is None:
+            menu_data = {}
+
         # Construct menu response according to OpenAPI spec
         menu_response = {
             'menuId': menu_data.get('menuId', str(uuid.uuid4())),
@@ -99,14 +124,22 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             'lastUpdated': menu_data.get('lastUpdated'),
             'items': items
         }
-        
+
+        _MENU_CACHE[today] = (menu_response, time.monotonic() + _MENU_CACHE_TTL)
         return create_success_response(menu_response)
         
     except ImportError:
-        # Fallback to direct DynamoDB calls for local testing
-        import boto3
-        dynamodb = boto3.client("dynamodb")
-        
+        # Fallback to direct DynamoDB calls for local testing; reuses the
+        # module-level client created during INIT
+        from boto3.dynamodb.types import TypeDeserializer
+
+        # One deserializer instance, bound locally; converting each item to a
+        # native dict in one pass beats six nested .get chains per item
+        deserialize = TypeDeserializer().deserialize
+
+        def _d(av):
+            return {k: deserialize(v) for k, v in av.items()}
+
         response = dynamodb.query(
             TableName=TABLE_NAME,
             KeyConditionExpression="PK = :pk",
@@ -114,26 +147,27 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 ":pk": {"S": f"MENU#{today}"}
             }
         )
-        
+
         if not response.get('Items'):
             raise NotFoundError("No menu found for today")
-        
+
         # Parse items (simplified for fallback)
         items = []
-        for item in response.get('Items', []):
-            if item.get('SK', {}).get('S', '').startswith('ITEM#'):
+        for raw in response.get('Items', ()):
+            item = _d(raw)
+            if str(item.get('SK', '')).startswith('ITEM#'):
                 items.append({
-                    'itemId': item.get('itemId', {}).get('S', ''),
-                    'menuId': item.get('menuId', {}).get('S', ''),
-                    'name': item.get('name', {}).get('S', ''),
-                    'description': item.get('description', {}).get('S'),
-                    'price': float(item.get('price', {}).get('N', 0)),
-                    'stockQty': int(item.get('stockQty', {}).get('N', 0)),
-                    'imageUrl': item.get('imageUrl', {}).get('S'),
-                    'isSpecial': item.get('isSpecial', {}).get('BOOL', False),
-                    'category': item.get('category', {}).get('S'),
-                    'spiceLevel': item.get('spiceLevel', {}).get('N'),
-                    'available': item.get('available', {}).get('BOOL', True)
+                    'itemId': item.get('itemId', ''),
+                    'menuId': item.get('menuId', ''),
+                    'name': item.get('name', ''),
+                    'description': item.get('description'),
+                    'price': float(item.get('price', 0)),
+                    'stockQty': int(item.get('stockQty', 0)),
+                    'imageUrl': item.get('imageUrl'),
+                    'isSpecial': bool(item.get('isSpecial', False)),
+                    'category': item.get('category'),
+                    'spiceLevel': item.get('spiceLevel'),
+                    'available': bool(item.get('available', True))
                 })
         
         menu_response = {
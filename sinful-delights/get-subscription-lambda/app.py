@@ -88,9 +88,8 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         return create_success_response(subscription_response)
         
     except ImportError:
-        # Fallback to direct DynamoDB calls
-        import boto3
-        dynamodb = boto3.client("dynamodb")
+        # Fallback to direct DynamoDB calls; reuses the module-level
+        # client created during INIT
         
         response = dynamodb.get_item(
             TableName=TABLE_NAME,
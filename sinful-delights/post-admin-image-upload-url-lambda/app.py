@@ -1,4 +1,4 @@
-import json
+import orjson
 import os
 import sys
 from typing import Dict, Any
@@ -48,6 +48,13 @@ except ImportError:
         file_url = f'https://{BUCKET_NAME}.s3.amazonaws.com/menu-images/{file_name}'
         return presigned_url, file_url
 
+# Response headers never vary, so one module-scope dict is shared by
+# every response instead of being rebuilt per invocation
+_HDRS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*'
+}
+
 @handle_exceptions
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -62,7 +69,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     validate_admin_access(event)
     
-    body = json.loads(event.get('body', '{}'))
+    body = orjson.loads(event.get('body') or b'{}')
     file_name = body.get('fileName')
     content_type = body.get('contentType')
     
@@ -85,9 +92,6 @@ def _response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
     """Fallback response formatter for local testing."""
     return {
         'statusCode': status_code,
-        'headers': {
-            'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': '*'
-        },
-        'body': json.dumps(body)
+        'headers': _HDRS,
+        'body': orjson.dumps(body, default=str).decode()
     }
\ No newline at end of file
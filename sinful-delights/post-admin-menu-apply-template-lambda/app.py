@@ -176,9 +176,8 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         })
         
     except ImportError:
-        # Fallback implementation (simplified)
-        import boto3
-        dynamodb = boto3.client("dynamodb")
+        # Fallback implementation (simplified); reuses the module-level
+        # client created during INIT
         
         # Get template (simplified)
         template_response = dynamodb.query(
@@ -12,7 +12,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'shared'))
 try:
     from shared.auth import validate_admin_access
     from shared.errors import handle_exceptions, create_success_response, ValidationError
-    from shared.dynamo import put_item, transact_write_items
+    from shared.dynamo import put_item, batch_put_items
     from shared.models import MenuUpsert, MenuItem
     from shared.utils import generate_uuid, validate_date_format
 except ImportError:
@@ -115,10 +115,11 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             if not item.get('name') or item.get('price') is None:
                 raise ValidationError(f"Missing required fields for item: {item}")
 
-    # Prepare DynamoDB items for transaction
+    # Prepare DynamoDB items for a batch write (menu header plus items
+    # are independent puts, so the 2x-WCU transaction isn't needed)
     table_name = os.environ.get("TABLE_NAME", "SinfulDelights")
-    transact_items = []
-    
+    batch_items = []
+
     # 1) Menu header (META)
     current_time = datetime.utcnow().isoformat() + 'Z'
     header_item = {
@@ -129,19 +130,17 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         "title": _ddb_string(menu_title),
         "isActive": _ddb_bool(is_active),
         "lastUpdated": _ddb_string(current_time),
-        "GSI1PK": _ddb_string(f"MENU_DATE#{menu_date}"),
-        "GSI1SK": _ddb_string(f"MENU#{menu_id}")
+        # Single GSI1 partition for all menu headers, date as sort key,
+        # so the menu listing can range-query BETWEEN two dates instead
+        # of scanning the table
+        "GSI1PK": _ddb_string("MENU_META"),
+        "GSI1SK": _ddb_string(menu_date)
     }
     
     if image_url:
         header_item["imageUrl"] = _ddb_string(image_url)
     
-    transact_items.append({
-        "Put": {
-            "TableName": table_name,
-            "Item": header_item
-        }
-    })
+    batch_items.append(header_item)
     
     # 2) Menu items
     for item_data in menu_items:
@@ -172,20 +171,21 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         if item_data.get('spiceLevel') is not None:
             item_record["spiceLevel"] = _ddb_number(item_data['spiceLevel'])
         
-        transact_items.append({
-            "Put": {
-                "TableName": table_name,
-                "Item": item_record
-            }
-        })
-    
+        batch_items.append(item_record)
+
     try:
-        # Execute transaction using shared utility if available
-        if 'transact_write_items' in globals():
-            transact_write_items(transact_items)
+        # Execute batch write using shared utility if available
+        if 'batch_put_items' in globals():
+            batch_put_items(batch_items)
         else:
             # Fallback for local testing
-            dynamodb.transact_write_items(TransactItems=transact_items)
+            for start in range(0, len(batch_items), 25):
+                dynamodb.batch_write_item(RequestItems={
+                    table_name: [
+                        {"PutRequest": {"Item": item}}
+                        for item in batch_items[start:start + 25]
+                    ]
+                })
         
         return create_success_response({
             "menuId": menu_id,
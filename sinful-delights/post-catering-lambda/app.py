@@ -1,5 +1,5 @@
 
-import json
+import orjson
 import os
 import sys
 from typing import Dict, Any
@@ -12,7 +12,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'shared'))
 try:
     from shared.auth import validate_customer_access, get_user_id
     from shared.errors import handle_exceptions, create_success_response, ValidationError
-    from shared.dynamo import put_item
+    from shared.dynamo import put_item, format_dynamodb_item
     from shared.models import CateringRequestCreate
     from shared.utils import generate_id
 except ImportError:
@@ -45,6 +45,13 @@ except ImportError:
     def generate_id():
         return str(uuid.uuid4())
 
+# Response headers never vary, so one module-scope dict is shared by
+# every response instead of being rebuilt per invocation
+_HDRS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*'
+}
+
 @handle_exceptions
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -60,12 +67,13 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     validate_customer_access(event)
     user_id = get_user_id(event)
     
-    body = json.loads(event.get('body', '{}'))
+    body = orjson.loads(event.get('body') or b'{}')
     catering_request = CateringRequestCreate(**body)
     
     request_id = generate_id()
     
     catering_data = {
+        'EntityType': 'CATERING',
         'requestId': request_id,
         'userId': user_id,
         'eventDate': catering_request.eventDate,
@@ -73,13 +81,15 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         'status': 'NEW',
         'createdAt': datetime.now().isoformat(),
         'budget': catering_request.budget,
-        'contact': catering_request.contact.dict()
+        'contact': catering_request.contact.model_dump(mode='json')
     }
     
     if catering_request.cuisinePreferences:
         catering_data['cuisinePreferences'] = catering_request.cuisinePreferences
     
-    put_item(f'USER#{user_id}', f'CATERING#{request_id}', catering_data)
+    put_item(format_dynamodb_item(
+        dict(catering_data, PK=f'USER#{user_id}', SK=f'CATERING#{request_id}')
+    ))
     
     return create_success_response({
         'requestId': request_id,
@@ -90,9 +100,6 @@ def _response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
     """Fallback response formatter for local testing."""
     return {
         'statusCode': status_code,
-        'headers': {
-            'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': '*'
-        },
-        'body': json.dumps(body)
+        'headers': _HDRS,
+        'body': orjson.dumps(body).decode()
     }
\ No newline at end of file
@@ -1,21 +1,38 @@
 import json
 import os
 import boto3
+from botocore.config import Config
 import uuid
 from datetime import datetime, timedelta
 from typing import Dict, Any
 
 # DynamoDB configuration
 TABLE_NAME = os.environ["TABLE_NAME"]
-dynamodb = boto3.client("dynamodb")
+dynamodb = boto3.client(
+    "dynamodb",
+    config=Config(max_pool_connections=16, retries={"mode": "adaptive"},
+                  tcp_keepalive=True)
+)
 
-def validate_api_key(event: Dict[str, Any]) -> bool:
-    """Validate the API key from the event headers."""
-    return 'X-API-Key' in event.get('headers', {})
+# The 401 envelope never varies, so it is built once at module scope and
+# returned as-is instead of re-allocating dicts and re-serializing the
+# body on every rejected request
+_UNAUTHORIZED = {
+    'statusCode': 401,
+    'headers': {
+        'Content-Type': 'application/json',
+        'Access-Control-Allow-Origin': '*'
+    },
+    'body': '{"error": "Unauthorized"}'
+}
 
-def validate_auth_token(event: Dict[str, Any]) -> bool:
-    """Validate Firebase Auth ID token."""
-    return 'Authorization' in event.get('headers', {})
+# Precomputed so validation doesn't rebuild the list per request
+_REQUIRED_FIELDS = ('plan', 'portionSize', 'mealsPerWeek')
+
+def _authed(event: Dict[str, Any]) -> bool:
+    """Check API key and Firebase Auth token headers in one pass."""
+    headers = event.get('headers') or {}
+    return 'X-API-Key' in headers and 'Authorization' in headers
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -29,23 +46,15 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         Dict[str, Any]: HTTP response with updated subscription details
     """
     # Validate API key and auth token
-    if not validate_api_key(event) or not validate_auth_token(event):
-        return {
-            'statusCode': 401,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({'error': 'Unauthorized'})
-        }
+    if not _authed(event):
+        return _UNAUTHORIZED
     
     try:
         body = json.loads(event.get('body', '{}'))
         user_id = event['requestContext']['authorizer']['claims']['sub']
         
         # Validate input
-        required_fields = ['plan', 'portionSize', 'mealsPerWeek']
-        if not all(body.get(field) for field in required_fields):
+        if not all(body.get(field) for field in _REQUIRED_FIELDS):
             return {
                 'statusCode': 400,
                 'headers': {
@@ -63,11 +72,15 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         subscription_item = {
             'PK': {'S': f'USER#{user_id}'},
             'SK': {'S': 'SUBSCRIPTION'},
+            'EntityType': {'S': 'SUBSCRIPTION'},
             'SubscriptionId': {'S': subscription_id},
             'Plan': {'S': body['plan']},
             'PortionSize': {'S': body['portionSize']},
             'MealsPerWeek': {'N': str(body['mealsPerWeek'])},
             'Status': {'S': 'Active'},
+            # Normalized sparse attribute: only subscription rows carry it,
+            # so a sparse GSI keyed on it indexes just the subscription set
+            'SubscriptionStatus': {'S': 'ACTIVE'},
             'NextDelivery': {'S': next_delivery}
         }
         
@@ -78,7 +91,9 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         # Perform DynamoDB write
         dynamodb.put_item(
             TableName=TABLE_NAME,
-            Item=subscription_item
+            Item=subscription_item,
+            ReturnValues='NONE',
+            ReturnConsumedCapacity='NONE'
         )
         
         return {
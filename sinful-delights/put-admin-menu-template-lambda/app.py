@@ -1,24 +1,40 @@
 import json
 import os
 import boto3
+from botocore.config import Config
 import uuid
 from typing import Dict, Any
 
 # DynamoDB configuration
 TABLE_NAME = os.environ["TABLE_NAME"]
-dynamodb = boto3.client("dynamodb")
+dynamodb = boto3.client(
+    "dynamodb",
+    config=Config(max_pool_connections=16, retries={"mode": "adaptive"},
+                  tcp_keepalive=True)
+)
+
+# The 401 envelope never varies, so it is built once at module scope and
+# returned as-is instead of re-allocating dicts and re-serializing the
+# body on every rejected request
+_UNAUTHORIZED = {
+    'statusCode': 401,
+    'headers': {
+        'Content-Type': 'application/json',
+        'Access-Control-Allow-Origin': '*'
+    },
+    'body': '{"error": "Unauthorized"}'
+}
 
 def validate_api_key(event: Dict[str, Any]) -> bool:
     """Validate the API key from the event headers."""
-    return 'X-API-Key' in event.get('headers', {})
+    return (event.get('headers') or {}).get('X-API-Key') is not None
 
 def validate_admin_token(event: Dict[str, Any]) -> bool:
     """Validate admin Firebase Auth ID token."""
-    try:
-        claims = event['requestContext']['authorizer']['claims']
-        return claims.get('role') == 'admin'
-    except:
-        return False
+    # Plain .get chain: no exception-frame setup on the hot path
+    claims = ((event.get('requestContext') or {})
+              .get('authorizer', {}).get('claims', {}))
+    return claims.get('role') == 'admin'
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -33,14 +49,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     # Validate API key and admin token
     if not validate_api_key(event) or not validate_admin_token(event):
-        return {
-            'statusCode': 401,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({'error': 'Unauthorized'})
-        }
+        return _UNAUTHORIZED
     
     try:
         # Get template ID from path parameters
@@ -121,7 +130,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             all_requests = delete_requests + put_requests
             for i in range(0, len(all_requests), 25):
                 batch = all_requests[i:i+25]
-                dynamodb.transact_write_items(TransactItems=batch)
+                dynamodb.transact_write_items(TransactItems=batch, ReturnConsumedCapacity='NONE')
         
         return {
             'statusCode': 200,
@@ -1,9 +1,47 @@
 """
 Authentication and authorization utilities for Sinful Delights API
 """
+import os
+import time
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from .errors import UnauthorizedError, ForbiddenError
 
+# Only used when a lambda verifies JWTs itself instead of relying on the
+# API Gateway authorizer to populate requestContext claims
+_JWT_PUBLIC_KEY = os.environ.get('FIREBASE_PUBLIC_KEY')
+_JWT_AUDIENCE = os.environ.get('FIREBASE_AUDIENCE')
+
+
+@lru_cache(maxsize=256)
+def _verify_token_cached(token: str, epoch: int) -> Dict[str, Any]:
+    """
+    Verify a JWT and return its claims, memoized per token. The RSA
+    verify costs milliseconds of CPU, so warm containers serve repeat
+    requests from the same user out of the cache; the epoch argument
+    rolls every 5 minutes so entries cannot outlive token revocation by
+    much. Failed verifications are not cached (lru_cache never stores a
+    raised exception), so a bad token is rechecked every time.
+    """
+    from jose import jwt, JWTError
+
+    try:
+        return jwt.decode(
+            token, _JWT_PUBLIC_KEY,
+            algorithms=['RS256'],
+            audience=_JWT_AUDIENCE
+        )
+    except JWTError as e:
+        raise UnauthorizedError(f"Invalid token: {str(e)}")
+
+
+def verify_token(token: str) -> Dict[str, Any]:
+    """
+    Verify a raw Firebase ID token and return its claims, with a
+    5-minute TTL cache across warm invocations.
+    """
+    return _verify_token_cached(token, int(time.monotonic() // 300))
+
 
 def validate_api_key(event: Dict[str, Any]) -> None:
     """
@@ -47,12 +85,15 @@ def validate_admin_access(event: Dict[str, Any]) -> Dict[str, Any]:
     First validates API key, then checks for admin role in claims.
     Returns claims if valid.
     """
-    validate_api_key(event)
-    
+    # Read the header dict once and run both checks against it rather than
+    # rebuilding it in each validator
+    headers = event.get('headers') or {}
+    if not (headers.get('X-API-Key') or headers.get('x-api-key')):
+        raise UnauthorizedError("Missing X-API-Key header")
+
     # For admin endpoints, Firebase token is optional but if present, must have admin role
-    headers = event.get('headers', {}) or {}
     auth_header = headers.get('Authorization') or headers.get('authorization')
-    
+
     if auth_header and auth_header.startswith('Bearer '):
         claims = validate_firebase_token(event)
         # Check for admin role
@@ -69,8 +110,21 @@ def validate_customer_access(event: Dict[str, Any]) -> Dict[str, Any]:
     Validate customer access (API key + Firebase token required).
     Returns user claims.
     """
-    validate_api_key(event)
-    return validate_firebase_token(event)
+    headers = event.get('headers') or {}
+    if not (headers.get('X-API-Key') or headers.get('x-api-key')):
+        raise UnauthorizedError("Missing X-API-Key header")
+
+    auth_header = headers.get('Authorization') or headers.get('authorization')
+    if not auth_header or not auth_header.startswith('Bearer '):
+        raise UnauthorizedError("Missing or invalid Authorization header")
+
+    try:
+        claims = event['requestContext']['authorizer']['claims']
+        if not claims:
+            raise UnauthorizedError("Invalid Firebase ID token")
+        return claims
+    except (KeyError, TypeError):
+        raise UnauthorizedError("Authentication failed - no user claims found")
 
 
 def get_user_id(event: Dict[str, Any]) -> str:
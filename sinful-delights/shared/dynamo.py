@@ -1,16 +1,60 @@
 """
 DynamoDB utilities for Sinful Delights API
 """
-import boto3
 import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from botocore.session import Session
 from .errors import OutOfStockError, NotFoundError, InternalError
 
 
-# Initialize DynamoDB client
-dynamodb = boto3.client('dynamodb')
-dynamodb_resource = boto3.resource('dynamodb')
+# Shared client config: larger connection pool for concurrent calls,
+# TCP keep-alive so warm containers reuse connections, adaptive retries,
+# and tight timeouts suited to single-digit-ms DynamoDB operations
+_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 3},
+    tcp_keepalive=True,
+    connect_timeout=1,
+    read_timeout=3
+)
+
+# Initialize the client straight from botocore so INIT skips boto3's
+# resource machinery entirely; the service model is still loaded once
+# here during Lambda INIT rather than on the first billed call
+_session = Session()
+dynamodb = _session.create_client('dynamodb', config=_CLIENT_CONFIG)
+
+try:
+    # Resolve credentials eagerly so the provider chain (env vars, role
+    # metadata) runs during INIT, then issue a cheap call that resolves
+    # the endpoint and exercises the request signer end to end. Warmup is
+    # never allowed to fail INIT
+    creds = _session.get_credentials()
+    if creds is not None:
+        creds.get_frozen_credentials()
+    dynamodb.describe_endpoints()
+except Exception:
+    pass
+
+# DAX is a write-through cache in front of DynamoDB, so routing point
+# reads and queries through it changes latency, not semantics. The
+# cluster is infrastructure-side: the DAX client only engages when
+# DAX_ENDPOINT is configured and the SDK is present in the layer.
+# Scans stay on the base client (DAX does not cache them)
+_dax = None
+if os.environ.get('DAX_ENDPOINT'):
+    try:
+        from amazondax import AmazonDaxClient
+        _dax = AmazonDaxClient(endpoint_url=os.environ['DAX_ENDPOINT'])
+    except Exception:
+        # Layer built without the DAX SDK or cluster unreachable at
+        # INIT; reads fall back to the base client
+        _dax = None
 
 
 def get_table_name() -> str:
@@ -108,9 +152,9 @@ def get_item(pk: str, sk: str) -> Optional[Dict[str, Any]]:
     Returns None if item not found.
     """
     table_name = get_table_name()
-    
+
     try:
-        response = dynamodb.get_item(
+        response = (_dax or dynamodb).get_item(
             TableName=table_name,
             Key={
                 'PK': {'S': pk},
@@ -131,12 +175,84 @@ def put_item(item: Dict[str, Any]) -> None:
     try:
         dynamodb.put_item(
             TableName=table_name,
-            Item=item
+            Item=item,
+            ReturnValues='NONE',
+            ReturnConsumedCapacity='NONE'
         )
     except ClientError as e:
         raise InternalError(f"Failed to put item: {str(e)}")
 
 
+def update_item(pk: str, sk: str, update_expression: str,
+                expression_values: Optional[Dict[str, Any]] = None,
+                condition_expression: Optional[str] = None,
+                expression_attribute_values: Optional[Dict[str, Any]] = None,
+                return_values: str = 'NONE',
+                expression_attribute_names: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Update a single item. Expression values are given as native Python
+    values and marshalled here. Returns the updated attributes when
+    return_values asks for them, or None if the condition failed.
+    """
+    table_name = get_table_name()
+
+    values = dict(expression_values or {})
+    if expression_attribute_values:
+        values.update(expression_attribute_values)
+
+    params = {
+        'TableName': table_name,
+        'Key': {
+            'PK': {'S': pk},
+            'SK': {'S': sk}
+        },
+        'UpdateExpression': update_expression,
+        'ReturnValues': return_values
+    }
+    if values:
+        params['ExpressionAttributeValues'] = format_dynamodb_item(values)
+    if condition_expression:
+        params['ConditionExpression'] = condition_expression
+    if expression_attribute_names:
+        params['ExpressionAttributeNames'] = expression_attribute_names
+
+    try:
+        response = dynamodb.update_item(**params)
+        return response.get('Attributes')
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+            return None
+        raise InternalError(f"Failed to update item: {str(e)}")
+
+
+def delete_item(pk: str, sk: str, condition_expression: Optional[str] = None) -> bool:
+    """
+    Delete a single item from DynamoDB.
+    Returns False instead of deleting when a condition expression is
+    given and fails, letting callers fold an existence check into the
+    delete itself.
+    """
+    table_name = get_table_name()
+
+    params = {
+        'TableName': table_name,
+        'Key': {
+            'PK': {'S': pk},
+            'SK': {'S': sk}
+        }
+    }
+    if condition_expression:
+        params['ConditionExpression'] = condition_expression
+
+    try:
+        dynamodb.delete_item(**params)
+        return True
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+            return False
+        raise InternalError(f"Failed to delete item: {str(e)}")
+
+
 def query_items(pk: str, sk_prefix: Optional[str] = None, **kwargs) -> List[Dict[str, Any]]:
     """
     Query items from DynamoDB by partition key and optional sort key prefix.
@@ -158,13 +274,150 @@ def query_items(pk: str, sk_prefix: Optional[str] = None, **kwargs) -> List[Dict
         
         # Add any additional parameters
         params.update(kwargs)
-        
-        response = dynamodb.query(**params)
-        return response.get('Items', [])
+
+        # Follow LastEvaluatedKey so results past the 1MB response cap
+        # aren't silently truncated
+        client = _dax or dynamodb
+        items = []
+        while True:
+            response = client.query(**params)
+            items.extend(response.get('Items', []))
+            last_key = response.get('LastEvaluatedKey')
+            if not last_key:
+                return items
+            params['ExclusiveStartKey'] = last_key
     except ClientError as e:
         raise InternalError(f"Failed to query items: {str(e)}")
 
 
+def query_pages(pk: str, sk_prefix: Optional[str] = None, **kwargs):
+    """
+    Yield Items pages for a partition-key query via the botocore
+    paginator. Lets callers process one page while the next is fetched
+    instead of accumulating the full result set.
+    """
+    table_name = get_table_name()
+
+    try:
+        params = {
+            'TableName': table_name,
+            'KeyConditionExpression': 'PK = :pk',
+            'ExpressionAttributeValues': {
+                ':pk': {'S': pk}
+            }
+        }
+
+        if sk_prefix:
+            params['KeyConditionExpression'] += ' AND begins_with(SK, :sk)'
+            params['ExpressionAttributeValues'][':sk'] = {'S': sk_prefix}
+
+        params.update(kwargs)
+
+        paginator = dynamodb.get_paginator('query')
+        for page in paginator.paginate(**params):
+            yield page.get('Items', [])
+    except ClientError as e:
+        raise InternalError(f"Failed to query items: {str(e)}")
+
+
+def query_index_pages(index_name: str, key_condition: str,
+                      expression_values: Dict[str, Any], **kwargs):
+    """
+    Yield Items pages for a GSI query via the botocore paginator.
+    Queries read only matching items, unlike scans which read the whole
+    table and filter afterwards.
+    """
+    table_name = get_table_name()
+
+    try:
+        paginator = dynamodb.get_paginator('query')
+        for page in paginator.paginate(
+            TableName=table_name,
+            IndexName=index_name,
+            KeyConditionExpression=key_condition,
+            ExpressionAttributeValues=expression_values,
+            **kwargs
+        ):
+            yield page.get('Items', [])
+    except ClientError as e:
+        raise InternalError(f"Failed to query index {index_name}: {str(e)}")
+
+
+def scan_page(filter_expression: str, expression_values: Dict[str, Any],
+              **kwargs) -> tuple:
+    """
+    Scan a single bounded page and return (items, last_evaluated_key).
+    Callers pass Limit/ExclusiveStartKey and hand the returned key back
+    as a continuation token, keeping worst-case duration and memory
+    proportional to one page instead of the whole table.
+    """
+    table_name = get_table_name()
+
+    try:
+        params = {
+            'TableName': table_name,
+            'FilterExpression': filter_expression,
+            'ExpressionAttributeValues': expression_values
+        }
+        params.update(kwargs)
+
+        response = dynamodb.scan(**params)
+        return response.get('Items', []), response.get('LastEvaluatedKey')
+    except ClientError as e:
+        raise InternalError(f"Failed to scan items: {str(e)}")
+
+
+def query_index_page(index_name: str, key_condition: str,
+                     expression_values: Dict[str, Any], **kwargs) -> tuple:
+    """
+    Query a single bounded page of a GSI and return
+    (items, last_evaluated_key). The counterpart of scan_page for
+    indexed reads: callers pass Limit/ExclusiveStartKey and round-trip
+    the returned key as a continuation token.
+    """
+    table_name = get_table_name()
+
+    try:
+        params = {
+            'TableName': table_name,
+            'IndexName': index_name,
+            'KeyConditionExpression': key_condition,
+            'ExpressionAttributeValues': expression_values
+        }
+        params.update(kwargs)
+
+        response = dynamodb.query(**params)
+        return response.get('Items', []), response.get('LastEvaluatedKey')
+    except ClientError as e:
+        raise InternalError(f"Failed to query index {index_name}: {str(e)}")
+
+
+def count_index_items(index_name: str, key_condition: str,
+                      expression_values: Dict[str, Any], **kwargs) -> int:
+    """
+    Count items matching a GSI query with Select=COUNT.
+    DynamoDB returns only the per-page count, so no item bytes cross the
+    wire and nothing is deserialized client-side.
+    """
+    table_name = get_table_name()
+
+    try:
+        paginator = dynamodb.get_paginator('query')
+        return sum(
+            page.get('Count', 0)
+            for page in paginator.paginate(
+                TableName=table_name,
+                IndexName=index_name,
+                KeyConditionExpression=key_condition,
+                ExpressionAttributeValues=expression_values,
+                Select='COUNT',
+                **kwargs
+            )
+        )
+    except ClientError as e:
+        raise InternalError(f"Failed to count index {index_name}: {str(e)}")
+
+
 def scan_with_filter(filter_expression: str, expression_values: Dict[str, Any], **kwargs) -> List[Dict[str, Any]]:
     """
     Scan table with filter expression.
@@ -185,12 +438,175 @@ def scan_with_filter(filter_expression: str, expression_values: Dict[str, Any],
         raise InternalError(f"Failed to scan items: {str(e)}")
 
 
+def parallel_scan(total_segments: int = 4, **kwargs) -> List[Dict[str, Any]]:
+    """
+    Scan the table across parallel segments with a thread pool.
+    Each segment pages through its LastEvaluatedKey; results are combined.
+    """
+    table_name = get_table_name()
+
+    def _scan_segment(segment: int) -> List[Dict[str, Any]]:
+        items = []
+        params = {
+            'TableName': table_name,
+            'Segment': segment,
+            'TotalSegments': total_segments
+        }
+        params.update(kwargs)
+        while True:
+            response = dynamodb.scan(**params)
+            items.extend(response.get('Items', []))
+            last_key = response.get('LastEvaluatedKey')
+            if not last_key:
+                return items
+            params['ExclusiveStartKey'] = last_key
+
+    try:
+        with ThreadPoolExecutor(max_workers=total_segments) as executor:
+            segments = executor.map(_scan_segment, range(total_segments))
+        return [item for segment in segments for item in segment]
+    except ClientError as e:
+        raise InternalError(f"Failed to scan items: {str(e)}")
+
+
+def scan_pages(**kwargs):
+    """
+    Yield Items pages from a table scan via the botocore paginator.
+    Streaming pages keeps peak memory at one page rather than the full
+    result set, so fold-style aggregations stay O(page).
+    """
+    table_name = get_table_name()
+
+    try:
+        paginator = dynamodb.get_paginator('scan')
+        for page in paginator.paginate(TableName=table_name, **kwargs):
+            yield page.get('Items', [])
+    except ClientError as e:
+        raise InternalError(f"Failed to scan items: {str(e)}")
+
+
+def batch_put_items(items: List[Dict[str, Any]]) -> None:
+    """
+    Write items with BatchWriteItem in chunks of 25 (the API maximum).
+    Non-transactional: costs 1x WCU per item versus 2x for transactions.
+    Chunks go out concurrently on a bounded thread pool; any
+    UnprocessedItems are resubmitted with jittered backoff.
+    """
+    table_name = get_table_name()
+
+    def _put_chunk(chunk: List[Dict[str, Any]]) -> None:
+        request_items = {
+            table_name: [{'PutRequest': {'Item': item}} for item in chunk]
+        }
+        delay = 0.05
+        while request_items:
+            response = dynamodb.batch_write_item(RequestItems=request_items)
+            request_items = response.get('UnprocessedItems')
+            if request_items:
+                # Decorrelated jitter keeps concurrent retries spread out
+                time.sleep(delay)
+                delay = min(1.0, random.uniform(0.05, delay * 3))
+
+    chunks = [items[start:start + 25] for start in range(0, len(items), 25)]
+
+    try:
+        if len(chunks) == 1:
+            _put_chunk(chunks[0])
+        elif chunks:
+            # Bounded so large imports don't spike past provisioned throughput
+            with ThreadPoolExecutor(max_workers=min(4, len(chunks))) as executor:
+                for future in [executor.submit(_put_chunk, c) for c in chunks]:
+                    future.result()
+    except ClientError as e:
+        raise InternalError(f"Failed to batch write items: {str(e)}")
+
+
+def batch_delete_items(keys: List[Dict[str, Any]]) -> None:
+    """
+    Delete items with BatchWriteItem in chunks of 25 (the API maximum).
+    Deletes are independent, so this costs 1x WCU per item versus 2x for
+    TransactWriteItems with no atomicity lost. Chunks are dispatched
+    concurrently on a bounded thread pool since each call is I/O-bound;
+    UnprocessedItems are resubmitted with exponential backoff.
+    """
+    table_name = get_table_name()
+
+    def _delete_chunk(chunk: List[Dict[str, Any]]) -> None:
+        request_items = {
+            table_name: [{'DeleteRequest': {'Key': key}} for key in chunk]
+        }
+        delay = 0.05
+        while request_items:
+            response = dynamodb.batch_write_item(RequestItems=request_items)
+            request_items = response.get('UnprocessedItems')
+            if request_items:
+                # Decorrelated jitter keeps concurrent chunks from
+                # retrying in lockstep against the same partition
+                time.sleep(delay)
+                delay = min(1.0, random.uniform(0.05, delay * 3))
+
+    chunks = [keys[start:start + 25] for start in range(0, len(keys), 25)]
+
+    try:
+        if len(chunks) == 1:
+            _delete_chunk(chunks[0])
+        elif chunks:
+            # Bounded so a huge menu cannot exhaust provisioned throughput
+            # or the client connection pool
+            with ThreadPoolExecutor(max_workers=min(8, len(chunks))) as executor:
+                for future in [executor.submit(_delete_chunk, c) for c in chunks]:
+                    future.result()
+    except ClientError as e:
+        raise InternalError(f"Failed to batch delete items: {str(e)}")
+
+
+def batch_get_items(keys: List[Dict[str, Any]], **kwargs) -> List[Dict[str, Any]]:
+    """
+    Fetch items with BatchGetItem in chunks of 100 (the API maximum),
+    turning N sequential GetItems into ceil(N/100) calls. Chunks go out
+    concurrently on a bounded thread pool; any UnprocessedKeys are
+    refetched with jittered backoff. Extra kwargs (ProjectionExpression,
+    ExpressionAttributeNames, ...) apply to every chunk.
+    """
+    table_name = get_table_name()
+
+    def _get_chunk(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        items = []
+        request_items = {table_name: dict(kwargs, Keys=chunk)}
+        delay = 0.05
+        while request_items:
+            response = dynamodb.batch_get_item(RequestItems=request_items)
+            items.extend(response.get('Responses', {}).get(table_name, []))
+            request_items = response.get('UnprocessedKeys')
+            if request_items:
+                # Decorrelated jitter keeps concurrent retries spread out
+                time.sleep(delay)
+                delay = min(1.0, random.uniform(0.05, delay * 3))
+        return items
+
+    chunks = [keys[start:start + 100] for start in range(0, len(keys), 100)]
+
+    try:
+        if len(chunks) == 1:
+            return _get_chunk(chunks[0])
+        if chunks:
+            with ThreadPoolExecutor(max_workers=min(4, len(chunks))) as executor:
+                results = executor.map(_get_chunk, chunks)
+            return [item for chunk_items in results for item in chunk_items]
+        return []
+    except ClientError as e:
+        raise InternalError(f"Failed to batch get items: {str(e)}")
+
+
 def transact_write(transact_items: List[Dict[str, Any]]) -> None:
     """
     Perform a transaction write with multiple items.
     """
     try:
-        dynamodb.transact_write_items(TransactItems=transact_items)
+        dynamodb.transact_write_items(
+            TransactItems=transact_items,
+            ReturnConsumedCapacity='NONE'
+        )
     except ClientError as e:
         error_code = e.response['Error']['Code']
         if error_code == 'TransactionCanceledException':
@@ -235,10 +651,12 @@ def format_dynamodb_item(item: Dict[str, Any]) -> Dict[str, Any]:
             formatted[key] = {'NULL': True}
         elif isinstance(value, str):
             formatted[key] = {'S': value}
-        elif isinstance(value, (int, float)):
-            formatted[key] = {'N': str(value)}
         elif isinstance(value, bool):
+            # Checked before int/float: bool subclasses int, so the N
+            # branch would otherwise marshal True as {'N': 'True'}
             formatted[key] = {'BOOL': value}
+        elif isinstance(value, (int, float)):
+            formatted[key] = {'N': str(value)}
         elif isinstance(value, list):
             formatted[key] = {'L': [format_dynamodb_item({'item': v})['item'] for v in value]}
         elif isinstance(value, dict):
@@ -1,10 +1,22 @@
 """
 Error handling utilities for Sinful Delights API
 """
-import json
+import orjson
 from typing import Dict, Any, Optional
 
 
+def _dumps(data: Any) -> str:
+    """Serialize a response body with orjson (default=str covers datetime)"""
+    return orjson.dumps(data, default=str).decode()
+
+
+# Shared across every response instead of re-allocating per call
+_RESPONSE_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*'
+}
+
+
 class APIError(Exception):
     """Base exception for API errors"""
     def __init__(self, code: str, message: str, status_code: int = 400, details: Optional[Dict[str, Any]] = None):
@@ -62,11 +74,8 @@ def create_error_response(error: APIError) -> Dict[str, Any]:
     """Create a standardized error response"""
     response = {
         'statusCode': error.status_code,
-        'headers': {
-            'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': '*'
-        },
-        'body': json.dumps({
+        'headers': _RESPONSE_HEADERS,
+        'body': _dumps({
             'error': {
                 'code': error.code,
                 'message': error.message,
@@ -81,11 +90,8 @@ def create_success_response(data: Any, status_code: int = 200) -> Dict[str, Any]
     """Create a standardized success response"""
     return {
         'statusCode': status_code,
-        'headers': {
-            'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': '*'
-        },
-        'body': json.dumps(data, default=str)  # default=str handles datetime serialization
+        'headers': _RESPONSE_HEADERS,
+        'body': _dumps(data)
     }
 
 
@@ -166,7 +166,7 @@ class Subscription(BaseModel):
     subscriptionId: str
     userId: str
     plan: SubscriptionPlan
-    nextDelivery: str = Field(regex=r"^\d{4}-\d{2}-\d{2}$")
+    nextDelivery: str = Field(pattern=r"^\d{4}-\d{2}-\d{2}$")
     status: SubscriptionStatusEnum
     skipDates: List[str] = []
     createdAt: datetime
@@ -199,7 +199,7 @@ class CateringContact(BaseModel):
 class CateringRequest(BaseModel):
     requestId: str
     userId: str
-    eventDate: str = Field(regex=r"^\d{4}-\d{2}-\d{2}$")
+    eventDate: str = Field(pattern=r"^\d{4}-\d{2}-\d{2}$")
     guestCount: int
     status: CateringStatusEnum
     createdAt: datetime
@@ -211,7 +211,7 @@ class CateringRequest(BaseModel):
 
 
 class CateringRequestCreate(BaseModel):
-    eventDate: str = Field(regex=r"^\d{4}-\d{2}-\d{2}$")
+    eventDate: str = Field(pattern=r"^\d{4}-\d{2}-\d{2}$")
     guestCount: int
     cuisinePreferences: Optional[str] = None
     budget: Optional[float] = None
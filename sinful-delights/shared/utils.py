@@ -1,28 +1,52 @@
 """
 General utilities for Sinful Delights API
 """
+import os
 import re
 import uuid
 from datetime import datetime, date
 from typing import Any, Dict, Optional
 
 
+# Hot-path patterns compiled once at import so per-call validation skips
+# the re module's cache lookup
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_STRIP_RE = re.compile(r'[\s\-\(\)\+]')
+
+# UUID4 strings are drawn from a pool refilled with one bulk urandom read,
+# amortizing the per-ID syscall across item-creation loops
+_UUID_POOL_SIZE = 256
+_uuid_pool = []
+
+
+def _refill_uuid_pool() -> None:
+    buf = os.urandom(16 * _UUID_POOL_SIZE)
+    for i in range(_UUID_POOL_SIZE):
+        raw = bytearray(buf[i * 16:(i + 1) * 16])
+        raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+        raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+        _uuid_pool.append(str(uuid.UUID(bytes=bytes(raw))))
+
+
 def generate_id(prefix: str = "") -> str:
     """Generate a unique ID with optional prefix"""
-    unique_id = str(uuid.uuid4())
+    if not _uuid_pool:
+        _refill_uuid_pool()
+    unique_id = _uuid_pool.pop()
     return f"{prefix}_{unique_id}" if prefix else unique_id
 
 
 def generate_uuid() -> str:
     """Generate a UUID string (alias for compatibility)"""
-    return str(uuid.uuid4())
+    return generate_id()
 
 
 def validate_date_format(date_str: str) -> bool:
     """Validate YYYY-MM-DD date format"""
     if not isinstance(date_str, str):
         return False
-    return bool(re.match(r"^\d{4}-\d{2}-\d{2}$", date_str))
+    return _DATE_RE.match(date_str) is not None
 
 
 def validate_iso8601_datetime(dt_str: str) -> bool:
@@ -53,7 +77,7 @@ def format_datetime_iso8601(dt: datetime) -> str:
 
 def get_today_date() -> str:
     """Get today's date in YYYY-MM-DD format"""
-    return date.today().strftime("%Y-%m-%d")
+    return date.today().isoformat()
 
 
 def validate_pagination_params(page: Optional[int], limit: Optional[int]) -> Dict[str, int]:
@@ -132,8 +156,7 @@ def validate_email(email: str) -> bool:
     if not isinstance(email, str) or len(email) > 254:
         return False
     
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return _EMAIL_RE.match(email) is not None
 
 
 def validate_phone(phone: str) -> bool:
@@ -142,7 +165,7 @@ def validate_phone(phone: str) -> bool:
         return False
     
     # Remove common formatting characters
-    cleaned = re.sub(r'[\s\-\(\)\+]', '', phone)
+    cleaned = _PHONE_STRIP_RE.sub('', phone)
     
     # Check if remaining characters are digits and length is reasonable
     return cleaned.isdigit() and 7 <= len(cleaned) <= 15